@@ -45,9 +45,44 @@ Usage:
 import argparse
 import json
 import sys
-import urllib.request
-import urllib.error
-from typing import Any, Dict, List, Optional
+import threading
+import urllib.parse
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+if TYPE_CHECKING:
+    import http.client
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to compact JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON from bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _print_json(obj: Any) -> None:
+    """Write obj to stdout as 2-space indented UTF-8 JSON, using orjson when available."""
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    else:
+        data = (json.dumps(obj, indent=2, ensure_ascii=False) + '\n').encode('utf-8')
+    # Flush pending text output first so it stays ahead of the raw bytes
+    sys.stdout.flush()
+    sys.stdout.buffer.write(data)
+    sys.stdout.buffer.flush()
 
 
 def parse_json_argument(value: str, arg_name: str) -> dict:
@@ -84,7 +119,22 @@ def parse_json_argument(value: str, arg_name: str) -> dict:
 
 
 class AnkiConnectClient:
-    """Client for interacting with AnkiConnect API."""
+    """
+    Client for interacting with AnkiConnect API.
+
+    Each thread reuses one keep-alive HTTP connection across calls, so keep a
+    single client alive for a sequence of calls instead of creating one per call.
+    """
+
+    # Request headers shared by every call (http.client adds Host and Content-Length)
+    _HEADERS = {'Content-Type': 'application/json'}
+
+    # Actions without side effects, safe to resend if the response is lost
+    _READ_ONLY_ACTIONS = frozenset({
+        'version', 'findNotes', 'notesInfo', 'findCards', 'cardsInfo',
+        'deckNames', 'deckNamesAndIds', 'getDeckStats', 'modelNames',
+        'modelNamesAndIds', 'modelFieldNames', 'getTags',
+    })
 
     def __init__(self, url: str = "http://localhost:8765"):
         """
@@ -95,6 +145,80 @@ class AnkiConnectClient:
         """
         self.url = url
         self.version = 6
+        self._local = threading.local()
+        # Every thread's connection, so close() can release them all
+        self._connections = []
+        self._connections_lock = threading.Lock()
+
+    def close(self) -> None:
+        """Close the keep-alive connections of all threads."""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
+
+    def _connection(self) -> 'http.client.HTTPConnection':
+        """Return this thread's connection to AnkiConnect, creating it on first use."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            # Imported on first use: http.client pulls in the email package, which
+            # dominates startup of --help and argument errors
+            import http.client
+            parts = urllib.parse.urlsplit(self.url)
+            if parts.scheme == 'https':
+                conn = http.client.HTTPSConnection(parts.hostname, parts.port)
+            elif parts.scheme == 'http':
+                conn = http.client.HTTPConnection(parts.hostname, parts.port)
+            else:
+                raise ValueError(f"unknown url type: {self.url!r}")
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+            self._local.path = urllib.parse.urlunsplit(('', '', parts.path or '/', parts.query, ''))
+        return conn
+
+    def _post(self, body: bytes, idempotent: bool = False) -> bytes:
+        """
+        POST a JSON body to AnkiConnect and return the raw response body.
+
+        Only idempotent requests reuse a kept-alive connection and are resent
+        on a fresh one if the server closed it. A reset after sending may come
+        after the server already ran the action, so other requests always get
+        a fresh connection and are never resent.
+
+        Raises:
+            urllib.error.HTTPError: If AnkiConnect answers with an HTTP error status
+            OSError: If the connection fails
+        """
+        import http.client
+
+        while True:
+            conn = self._connection()
+            if not idempotent:
+                # http.client reconnects on the next request
+                conn.close()
+            reused = conn.sock is not None
+            try:
+                conn.request('POST', self._local.path, body, self._HEADERS)
+                response = conn.getresponse()
+                # With Content-Length set, read() fills a single buffer of exactly that
+                # size; invoke() parses those bytes directly, without a decoded str copy
+                data = response.read()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                conn.close()
+                # The server closed the idle kept-alive connection; retry once on a fresh one
+                if reused:
+                    continue
+                raise
+            except Exception:
+                conn.close()
+                raise
+
+            if response.status >= 400:
+                import urllib.error
+                raise urllib.error.HTTPError(self.url, response.status, response.reason, response.headers, None)
+            return data
 
     def invoke(self, action: str, params: Optional[Dict[str, Any]] = None) -> Any:
         """
@@ -118,13 +242,11 @@ class AnkiConnectClient:
         if params is not None:
             request_data["params"] = params
 
-        request_json = json.dumps(request_data).encode('utf-8')
+        request_json = _json_dumps(request_data)
 
         try:
-            req = urllib.request.Request(self.url, request_json, {'Content-Type': 'application/json'})
-            response = urllib.request.urlopen(req)
-            response_data = json.loads(response.read().decode('utf-8'))
-        except urllib.error.URLError as e:
+            response_data = _json_loads(self._post(request_json, action in self._READ_ONLY_ACTIONS))
+        except OSError as e:
             raise Exception(f"Failed to connect to AnkiConnect at {self.url}. "
                           f"Make sure Anki is running and AnkiConnect is installed. Error: {e}")
         except Exception as e:
@@ -181,19 +303,24 @@ class AnkiConnectClient:
 
         return self.invoke("addNote", {"note": note})
 
-    def add_notes(self, notes: List[Dict[str, Any]]) -> List[Optional[int]]:
+    def add_notes(self, notes: List[Dict[str, Any]],
+                  batch_size: int = 500) -> List[Optional[int]]:
         """
         Add multiple notes to Anki.
 
+        Notes are sent in batches of batch_size so a large import never builds
+        one huge request. If a batch fails, notes from earlier batches stay added.
+
         Args:
             notes: List of note dictionaries, each containing:
                 - deckName: Name of the deck
                 - modelName: Name of the note type
                 - fields: Dictionary of field names to values
                 - tags: Optional list of tags
+            batch_size: Maximum number of notes per addNotes request (default: 500)
 
         Returns:
-            List of note IDs (None for failed notes)
+            List of note IDs (None for failed notes), in input order
 
         Example:
             note_ids = client.add_notes([
@@ -211,7 +338,10 @@ class AnkiConnectClient:
                 }
             ])
         """
-        return self.invoke("addNotes", {"notes": notes})
+        note_ids = []
+        for start in range(0, len(notes), batch_size):
+            note_ids.extend(self.invoke("addNotes", {"notes": notes[start:start + batch_size]}))
+        return note_ids
 
     def find_notes(self, query: str) -> List[int]:
         """
@@ -250,11 +380,12 @@ class AnkiConnectClient:
         result = self.invoke("notesInfo", {"notes": note_ids})
 
         if fields is not None and result:
+            wanted = frozenset(fields)
             for note in result:
                 if "fields" in note:
                     note["fields"] = {
                         k: v for k, v in note["fields"].items()
-                        if k in fields
+                        if k in wanted
                     }
 
         return result
@@ -520,6 +651,12 @@ Examples:
         help='AnkiConnect endpoint URL (default: http://localhost:8765)'
     )
 
+    parser.add_argument(
+        '--check',
+        action='store_true',
+        help='Verify the AnkiConnect connection before running the command'
+    )
+
     subparsers = parser.add_subparsers(dest='command', help='Command to execute')
     subparsers.required = True
 
@@ -570,8 +707,9 @@ Examples:
     # Initialize client
     client = AnkiConnectClient(url=args.url)
 
-    # Check connection
-    if not client.check_connection():
+    # Optional pre-flight check; otherwise the command's own request reports
+    # connection failures, saving a round trip on every call
+    if args.check and not client.check_connection():
         print("ERROR: Cannot connect to AnkiConnect.", file=sys.stderr)
         print("Make sure Anki is running and AnkiConnect plugin is installed.", file=sys.stderr)
         sys.exit(1)
@@ -585,8 +723,7 @@ Examples:
             print(f"Note created with ID: {note_id}")
 
         elif args.command == 'add-notes':
-            with open(args.json_file, 'r') as f:
-                notes = json.load(f)
+            notes = _json_loads(Path(args.json_file).read_bytes())
 
             # Validate that notes is a list
             if not isinstance(notes, list):
@@ -595,6 +732,21 @@ Examples:
                     f"Expected format: [{...}, {...}]"
                 )
 
+            # Create decks the notes refer to but Anki lacks, using one deckNames
+            # call, so their notes are not rejected. Anki deck names are
+            # case-insensitive.
+            existing_decks = {deck.casefold() for deck in client.deck_names()}
+            missing_decks = sorted({
+                note['deckName'] for note in notes
+                if isinstance(note, dict) and isinstance(note.get('deckName'), str)
+                and note['deckName'].casefold() not in existing_decks
+            })
+            if missing_decks:
+                from concurrent.futures import ThreadPoolExecutor
+                with ThreadPoolExecutor(max_workers=min(8, len(missing_decks))) as executor:
+                    list(executor.map(client.create_deck, missing_decks))
+                print(f"Created {len(missing_decks)} missing deck(s): {', '.join(missing_decks)}")
+
             note_ids = client.add_notes(notes)
             print(f"Created {len([n for n in note_ids if n is not None])} notes")
             print(f"Note IDs: {note_ids}")
@@ -602,23 +754,22 @@ Examples:
         elif args.command == 'find-notes':
             note_ids = client.find_notes(args.query)
             print(f"Found {len(note_ids)} notes")
-            print(json.dumps(note_ids, indent=2))
+            _print_json(note_ids)
 
         elif args.command == 'notes-info':
             fields_filter = args.fields.split(',') if args.fields else None
             notes = client.notes_info(args.note_ids, fields=fields_filter)
-            print(json.dumps(notes, indent=2))
+            _print_json(notes)
 
         elif args.command == 'find-cards':
             card_ids = client.find_cards(args.query)
             print(f"Found {len(card_ids)} cards")
-            print(json.dumps(card_ids, indent=2))
+            _print_json(card_ids)
 
         elif args.command == 'deck-names':
             decks = client.deck_names()
-            print("Available decks:")
-            for deck in sorted(decks):
-                print(f"  - {deck}")
+            decks.sort()
+            sys.stdout.write("Available decks:\n" + "".join(f"  - {deck}\n" for deck in decks))
 
         elif args.command == 'create-deck':
             deck_id = client.create_deck(args.deck)
@@ -626,9 +777,8 @@ Examples:
 
         elif args.command == 'model-names':
             models = client.model_names()
-            print("Available note types:")
-            for model in sorted(models):
-                print(f"  - {model}")
+            models.sort()
+            sys.stdout.write("Available note types:\n" + "".join(f"  - {model}\n" for model in models))
 
         elif args.command == 'sync':
             print("Syncing with AnkiWeb...")
@@ -638,11 +788,13 @@ Examples:
         elif args.command == 'invoke':
             params = parse_json_argument(args.params, '--params')
             result = client.invoke(args.action, params)
-            print(json.dumps(result, indent=2))
+            _print_json(result)
 
     except Exception as e:
         print(f"ERROR: {e}", file=sys.stderr)
         sys.exit(1)
+    finally:
+        client.close()
 
 
 if __name__ == '__main__':
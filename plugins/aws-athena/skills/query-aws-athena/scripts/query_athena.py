@@ -18,15 +18,48 @@ Usage:
 """
 
 import argparse
+import functools
 import time
 import sys
 from pathlib import Path
 
 
+@functools.lru_cache(maxsize=16)
+def _get_session(profile=None, region=None):
+    """Create a boto3 session once per (profile, region) and reuse it."""
+    import boto3
+
+    session_kwargs = {}
+    if profile:
+        session_kwargs['profile_name'] = profile
+    if region:
+        session_kwargs['region_name'] = region
+    return boto3.Session(**session_kwargs)
+
+
+@functools.lru_cache(maxsize=16)
+def _get_client(service_name, profile=None, region=None):
+    """Create a boto3 client once per (service, profile, region) and reuse it."""
+    from botocore.config import Config
+
+    return _get_session(profile, region).client(
+        service_name,
+        config=Config(
+            max_pool_connections=50,
+            retries={'mode': 'adaptive', 'max_attempts': 5}
+        )
+    )
+
+
 class AthenaQueryExecutor:
     """Execute Athena queries and download results from S3."""
 
-    def __init__(self, database, output_location, region=None, profile=None):
+    # Status polling backoff: start fast for short queries, back off for long ones
+    POLL_INITIAL_DELAY_SECONDS = 0.05
+    POLL_MAX_DELAY_SECONDS = 5.0
+    POLL_BACKOFF_FACTOR = 1.5
+
+    def __init__(self, database, output_location, region=None, profile=None, max_concurrency=20):
         """
         Initialize Athena query executor.
 
@@ -35,18 +68,14 @@ class AthenaQueryExecutor:
             output_location: S3 location for query results (e.g., s3://bucket/path/)
             region: AWS region (optional, uses default if not specified)
             profile: AWS profile name (optional, uses default credential chain if not specified)
+            max_concurrency: Number of parallel part downloads for large result files (default: 20)
         """
-        import boto3
+        from boto3.s3.transfer import TransferConfig
         self.database = database
         self.output_location = output_location
 
         # Create session with optional profile
-        session_kwargs = {}
-        if profile:
-            session_kwargs['profile_name'] = profile
-        if region:
-            session_kwargs['region_name'] = region
-        session = boto3.Session(**session_kwargs)
+        session = _get_session(profile, region)
 
         if not session.region_name:
             print(
@@ -56,8 +85,16 @@ class AthenaQueryExecutor:
             )
             sys.exit(1)
 
-        self.athena_client = session.client('athena')
-        self.s3_client = session.client('s3')
+        self.athena_client = _get_client('athena', profile, region)
+        self.s3_client = _get_client('s3', profile, region)
+
+        # Large result files are fetched as parallel multipart ranged GETs
+        self._s3_transfer_config = TransferConfig(
+            multipart_threshold=8 * 1024 * 1024,
+            multipart_chunksize=16 * 1024 * 1024,
+            max_concurrency=max_concurrency,
+            use_threads=True
+        )
 
     def execute_query(self, query, wait=True):
         """
@@ -93,10 +130,14 @@ class AthenaQueryExecutor:
         Args:
             query_execution_id: The ID of the query execution
             timeout_seconds: Maximum seconds to wait before raising TimeoutError (default: 30m)
+
+        Returns:
+            response: The final get_query_execution response of a succeeded query
         """
         print("Waiting for query to complete...")
 
-        elapsed = 0
+        elapsed = 0.0
+        delay = self.POLL_INITIAL_DELAY_SECONDS
         while True:
             response = self.athena_client.get_query_execution(
                 QueryExecutionId=query_execution_id
@@ -112,8 +153,9 @@ class AthenaQueryExecutor:
                     f"Athena query {query_execution_id} did not complete within {timeout_seconds}s"
                 )
 
-            time.sleep(1)
-            elapsed += 1
+            time.sleep(delay)
+            elapsed += delay
+            delay = min(delay * self.POLL_BACKOFF_FACTOR, self.POLL_MAX_DELAY_SECONDS)
 
         if status == 'SUCCEEDED':
             print("✓ Query completed successfully")
@@ -125,7 +167,10 @@ class AthenaQueryExecutor:
             print("✗ Query was cancelled", file=sys.stderr)
             sys.exit(1)
 
-    def download_results_from_s3(self, query_execution_id, output_file=None, format='csv'):
+        return response
+
+    def download_results_from_s3(self, query_execution_id, output_file=None, format='csv',
+                                 s3_output_location=None):
         """
         Download query results from S3.
 
@@ -137,6 +182,8 @@ class AthenaQueryExecutor:
             query_execution_id: The ID of the query execution
             output_file: Local file path to save results (optional)
             format: Output format (default: csv)
+            s3_output_location: S3 URI of the results file (optional, looked up
+                from the query execution if not specified)
 
         Returns:
             local_file_path: Path to the downloaded results file
@@ -144,17 +191,17 @@ class AthenaQueryExecutor:
         print("Downloading results from S3...")
 
         # Get query execution details to find S3 location
-        response = self.athena_client.get_query_execution(
-            QueryExecutionId=query_execution_id
-        )
-
-        s3_output_location = response['QueryExecution']['ResultConfiguration']['OutputLocation']
+        if s3_output_location is None:
+            response = self.athena_client.get_query_execution(
+                QueryExecutionId=query_execution_id
+            )
+            s3_output_location = response['QueryExecution']['ResultConfiguration']['OutputLocation']
 
         # Parse S3 location
         # Format: s3://bucket-name/path/to/results.csv
-        s3_parts = s3_output_location.replace('s3://', '').split('/', 1)
-        bucket = s3_parts[0]
-        key = s3_parts[1]
+        if not s3_output_location.startswith('s3://'):
+            raise ValueError(f"Unexpected S3 output location: {s3_output_location}")
+        bucket, _, key = s3_output_location[5:].partition('/')
 
         # Determine output file name
         if output_file is None:
@@ -162,7 +209,7 @@ class AthenaQueryExecutor:
 
         # Download from S3
         print(f"Downloading from s3://{bucket}/{key}")
-        self.s3_client.download_file(bucket, key, output_file)
+        self.s3_client.download_file(bucket, key, output_file, Config=self._s3_transfer_config)
 
         print(f"✓ Results downloaded to: {output_file}")
         return output_file
@@ -179,8 +226,15 @@ class AthenaQueryExecutor:
         Returns:
             local_file_path: Path to the downloaded results file
         """
-        query_execution_id = self.execute_query(query, wait=True)
-        return self.download_results_from_s3(query_execution_id, output_file, format)
+        query_execution_id = self.execute_query(query, wait=False)
+
+        # The final poll response already carries the S3 location of the results
+        response = self._wait_for_query_completion(query_execution_id)
+        s3_output_location = response['QueryExecution']['ResultConfiguration']['OutputLocation']
+
+        return self.download_results_from_s3(
+            query_execution_id, output_file, format, s3_output_location=s3_output_location
+        )
 
 
 def main():
@@ -250,6 +304,13 @@ Examples:
         help='AWS profile name (required)'
     )
 
+    parser.add_argument(
+        '--max-concurrency',
+        type=int,
+        default=20,
+        help='Number of parallel part downloads for large result files (default: 20)'
+    )
+
     parser.add_argument(
         '--no-download',
         action='store_true',
@@ -269,7 +330,8 @@ Examples:
         database=args.database,
         output_location=args.output_location,
         region=args.region,
-        profile=args.profile
+        profile=args.profile,
+        max_concurrency=args.max_concurrency
     )
 
     # Execute query
@@ -6,13 +6,28 @@ Execute CloudWatch Log Insights queries with progress tracking and flexible outp
 """
 
 import argparse
-import csv
-import json
+import calendar
+import functools
+import os
+import re
 import sys
 import time
-from datetime import datetime, timedelta, timezone
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
+
+# Heavier modules (boto3, csv, json, orjson, concurrent.futures) are imported
+# where they are first needed so --help and argument errors return quickly.
+
+
+@functools.lru_cache(maxsize=None)
+def _orjson():
+    """Import orjson on first use; None when it is not installed."""
+    try:
+        import orjson
+        return orjson
+    except ImportError:
+        return None
 
 
 class CloudWatchQueryError(Exception):
@@ -30,9 +45,121 @@ class QuerySyntaxError(CloudWatchQueryError):
     pass
 
 
+# ISO 8601 date with optional time, fraction and UTC offset, e.g. 2025-12-05T10:00:00.123+02:00
+_ISO_RE = re.compile(
+    r'^(\d{4})-(\d{2})-(\d{2})'
+    r'(?:[T ](\d{2}):(\d{2})(?::(\d{2})(?:\.(\d+))?)?(Z|[+-]\d{2}:?\d{2})?)?$'
+)
+
+# Relative time such as 30s, 5m, 1h, 2d
+_REL_RE = re.compile(r'^(\d+)([smhd])$')
+
+_MS_PER_SECOND = 1000
+_MS_PER_MINUTE = 60 * _MS_PER_SECOND
+_MS_PER_HOUR = 60 * _MS_PER_MINUTE
+_MS_PER_DAY = 24 * _MS_PER_HOUR
+
+# Relative time unit -> milliseconds
+_REL_UNITS = {
+    's': _MS_PER_SECOND,
+    'm': _MS_PER_MINUTE,
+    'h': _MS_PER_HOUR,
+    'd': _MS_PER_DAY,
+}
+
+# Rolling windows ending now, in milliseconds; 'today' and 'yesterday' align to UTC midnight instead
+_NAMED_RANGES = {
+    'last-hour': _MS_PER_HOUR,
+    'last-24h': 24 * _MS_PER_HOUR,
+    'last-day': _MS_PER_DAY,
+    'last-week': 7 * _MS_PER_DAY,
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_absolute_time(time_str: str) -> Optional[int]:
+    """
+    Parse an ISO 8601 time string to Unix timestamp in milliseconds.
+
+    The result does not depend on the current time, so it is cached.
+
+    Args:
+        time_str: Stripped time string
+
+    Returns:
+        Unix timestamp in milliseconds, or None if time_str is not ISO 8601
+    """
+    match = _ISO_RE.match(time_str)
+    if not match:
+        return _parse_isoformat(time_str)
+
+    groups = match.groups()
+    year, month, day = int(groups[0]), int(groups[1]), int(groups[2])
+    hour, minute, second = (int(g or 0) for g in groups[3:6])
+    fraction, offset = groups[6], groups[7]
+
+    # Reject out-of-range fields that timegm would silently normalize
+    if not (1 <= year and 1 <= month <= 12 and hour < 24 and minute < 60 and second < 60):
+        return None
+    if not 1 <= day <= calendar.monthrange(year, month)[1]:
+        return None
+
+    # Integer epoch math on the captured fields; no datetime or float rounding
+    timestamp_ms = calendar.timegm((year, month, day, hour, minute, second)) * _MS_PER_SECOND
+    if fraction:
+        timestamp_ms += int(fraction[:3].ljust(3, '0'))
+
+    # Inputs without an offset (including date-only) are taken as UTC
+    if offset and offset != 'Z':
+        digits = offset[1:].replace(':', '')
+        offset_hours, offset_minutes = int(digits[:2]), int(digits[2:])
+        if offset_hours >= 24 or offset_minutes >= 60:
+            return None
+        offset_ms = offset_hours * _MS_PER_HOUR + offset_minutes * _MS_PER_MINUTE
+        timestamp_ms += offset_ms if offset[0] == '-' else -offset_ms
+
+    return timestamp_ms
+
+
+def _parse_isoformat(time_str: str) -> Optional[int]:
+    """
+    Parse ISO 8601 forms the regex does not cover with datetime.fromisoformat.
+
+    On Python 3.11+ this accepts the full ISO 8601 set (e.g. "20251205T100000Z",
+    week dates); older versions need "Z" spelled as "+00:00".
+
+    Args:
+        time_str: Stripped time string
+
+    Returns:
+        Unix timestamp in milliseconds, or None if time_str is not ISO 8601
+    """
+    if sys.version_info < (3, 11):
+        time_str = time_str.replace('Z', '+00:00')
+    try:
+        dt = datetime.fromisoformat(time_str)
+        # utctimetuple() converts aware values to UTC and keeps naive ones as-is (UTC)
+        return calendar.timegm(dt.utctimetuple()) * _MS_PER_SECOND + dt.microsecond // 1000
+    except (ValueError, OverflowError):
+        return None
+
+
 class CloudWatchLogsQueryExecutor:
     """Execute CloudWatch Log Insights queries with progress tracking."""
 
+    # GetQueryResults polling backoff; each poll returns all results so far,
+    # so long queries should poll less often
+    POLL_INITIAL_DELAY_SECONDS = 2.0
+    POLL_MAX_DELAY_SECONDS = 30.0
+    POLL_BACKOFF_FACTOR = 1.5
+
+    # Exact names sharing a shorter prefix get separate listings, since a
+    # short or empty prefix could page through most of the account
+    MIN_SHARED_PREFIX_LENGTH = 16
+    # Pages a grouped listing may scan before its remaining names fall
+    # back to one lookup each
+    MAX_GROUP_LISTING_PAGES = 2
+
     def __init__(self, region: Optional[str] = None, profile: Optional[str] = None):
         """
         Initialize CloudWatch Logs query executor.
@@ -71,155 +198,99 @@ class CloudWatchLogsQueryExecutor:
             Unix timestamp in milliseconds
         """
         time_str = time_str.strip()
+        lowered = time_str.lower()
+
+        # Handle Unix timestamp in milliseconds (13 digits)
+        if len(time_str) == 13 and time_str.isdigit():
+            return int(time_str)
+
+        # Single clock read shared by every now-relative branch
+        now_ms = time.time_ns() // 1_000_000
 
         # Handle "now"
-        if time_str.lower() == 'now':
-            return int(datetime.now(timezone.utc).timestamp() * 1000)
+        if lowered == 'now':
+            return now_ms
 
         # Handle named ranges
-        named_ranges = {
-            'last-hour': timedelta(hours=1),
-            'last-24h': timedelta(hours=24),
-            'last-day': timedelta(days=1),
-            'last-week': timedelta(weeks=1),
-            'yesterday': timedelta(days=1),
-            'today': timedelta(hours=0),
-        }
-
-        if time_str.lower() in named_ranges:
-            if time_str.lower() == 'today':
-                # Start of today
-                now = datetime.now(timezone.utc)
-                start_of_day = now.replace(hour=0, minute=0, second=0, microsecond=0)
-                return int(start_of_day.timestamp() * 1000)
-            elif time_str.lower() == 'yesterday':
-                # Start of yesterday
-                now = datetime.now(timezone.utc)
-                start_of_yesterday = (now - timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
-                return int(start_of_yesterday.timestamp() * 1000)
-            else:
-                delta = named_ranges[time_str.lower()]
-                return int((datetime.now(timezone.utc) - delta).timestamp() * 1000)
+        if lowered == 'today':
+            # Start of today (UTC midnight)
+            return now_ms - now_ms % _MS_PER_DAY
+        if lowered == 'yesterday':
+            # Start of yesterday
+            return now_ms - now_ms % _MS_PER_DAY - _MS_PER_DAY
+        if lowered in _NAMED_RANGES:
+            return now_ms - _NAMED_RANGES[lowered]
 
         # Handle relative times like "1h", "2d", "30m"
-        if time_str[-1] in ['h', 'd', 'm', 's']:
-            try:
-                unit = time_str[-1]
-                value = int(time_str[:-1])
-
-                if unit == 's':
-                    delta = timedelta(seconds=value)
-                elif unit == 'm':
-                    delta = timedelta(minutes=value)
-                elif unit == 'h':
-                    delta = timedelta(hours=value)
-                elif unit == 'd':
-                    delta = timedelta(days=value)
-
-                return int((datetime.now(timezone.utc) - delta).timestamp() * 1000)
-            except ValueError:
-                pass
-
-        # Handle Unix timestamp in milliseconds (13 digits)
-        if time_str.isdigit() and len(time_str) == 13:
-            return int(time_str)
-
-        # Handle ISO 8601 formats
-        try:
-            # Try with timezone
-            dt = datetime.fromisoformat(time_str.replace('Z', '+00:00'))
-            return int(dt.timestamp() * 1000)
-        except ValueError:
-            pass
-
-        # Try without timezone (assume UTC)
-        try:
-            dt = datetime.strptime(time_str, "%Y-%m-%dT%H:%M:%S").replace(tzinfo=timezone.utc)
-            return int(dt.timestamp() * 1000)
-        except ValueError:
-            pass
+        if time_str[-1:] in _REL_UNITS:
+            match = _REL_RE.match(time_str)
+            if match:
+                return now_ms - int(match.group(1)) * _REL_UNITS[match.group(2)]
 
-        # Try date only (assume UTC midnight)
-        try:
-            dt = datetime.strptime(time_str, "%Y-%m-%d").replace(tzinfo=timezone.utc)
-            return int(dt.timestamp() * 1000)
-        except ValueError:
-            pass
+        # Handle ISO 8601 formats (cached, independent of the current time)
+        timestamp_ms = _parse_absolute_time(time_str)
+        if timestamp_ms is not None:
+            return timestamp_ms
 
         raise ValueError(f"Unable to parse time format: {time_str}\n"
                         "Supported formats: ISO 8601, Unix ms, relative (1h, 2d), named (last-hour, now)")
 
-    def validate_log_groups(self, log_groups: List[str]) -> List[str]:
+    def validate_log_groups(self, log_groups: List[str], validate_existence: bool = False) -> List[str]:
         """
-        Validate log groups exist and expand wildcards.
+        Expand wildcards and optionally validate that exact log groups exist.
+
+        Exact names are passed through unchecked by default: start_query
+        rejects unknown log groups itself, so checking them up front costs an
+        extra API call on every successful query.
 
         Args:
             log_groups: List of log group names/patterns
+            validate_existence: Check exact names with describe_log_groups before querying
 
         Returns:
             List of validated log group names
 
         Raises:
-            LogGroupNotFoundError: If log group doesn't exist
+            LogGroupNotFoundError: If log group doesn't exist or a pattern matches nothing
         """
+        # CloudWatch has a limit of 20 log groups per query. Every entry yields
+        # at least one group, so entries past the 20th are dropped before any
+        # API call is spent validating them.
+        if len(log_groups) > 20:
+            print(f"WARNING: CloudWatch limits queries to 20 log groups. "
+                  f"Using first 20 of {len(log_groups)} log groups/patterns.", file=sys.stderr)
+            log_groups = log_groups[:20]
+
         validated_groups = []
 
+        # Resolve exact names with shared prefix listings instead of one call each
+        exact_names = [lg for lg in log_groups if '*' not in lg]
+        check_exact = validate_existence and bool(exact_names)
+        existing_groups = self._find_existing_log_groups(exact_names) if check_exact else set()
+
+        # Expand wildcard patterns; independent listings run concurrently
+        wildcard_patterns = list(dict.fromkeys(lg for lg in log_groups if '*' in lg))
+        if len(wildcard_patterns) > 1:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=min(8, len(wildcard_patterns))) as executor:
+                pattern_expansions = dict(zip(
+                    wildcard_patterns,
+                    executor.map(self._expand_log_group_pattern, wildcard_patterns)
+                ))
+        else:
+            pattern_expansions = {p: self._expand_log_group_pattern(p) for p in wildcard_patterns}
+
         for log_group_pattern in log_groups:
             if '*' in log_group_pattern:
-                # Handle wildcard patterns
-                prefix = log_group_pattern.replace('*', '')
-                try:
-                    paginator = self.logs_client.get_paginator('describe_log_groups')
-                    page_iterator = paginator.paginate(logGroupNamePrefix=prefix)
-
-                    pattern_matches = []
-                    for page in page_iterator:
-                        for log_group in page['logGroups']:
-                            pattern_matches.append(log_group['logGroupName'])
-
-                    if not pattern_matches:
-                        raise LogGroupNotFoundError(
-                            f"No log groups found matching pattern: {log_group_pattern}"
-                        )
-                    validated_groups.extend(pattern_matches)
-                except Exception as e:
-                    if 'ResourceNotFoundException' in str(e):
-                        raise LogGroupNotFoundError(
-                            f"Log group not found: {log_group_pattern}"
-                        )
-                    raise
+                validated_groups.extend(pattern_expansions[log_group_pattern])
             else:
-                # Validate single log group with exact match
-                try:
-                    paginator = self.logs_client.get_paginator('describe_log_groups')
-                    page_iterator = paginator.paginate(
-                        logGroupNamePrefix=log_group_pattern,
-                        limit=1
+                if check_exact and log_group_pattern not in existing_groups:
+                    raise LogGroupNotFoundError(
+                        f"Log group not found: {log_group_pattern}"
                     )
-                    exact_match = False
-                    for page in page_iterator:
-                        for lg in page['logGroups']:
-                            if lg['logGroupName'] == log_group_pattern:
-                                exact_match = True
-                                break
-                        if exact_match:
-                            break
-                    if not exact_match:
-                        raise LogGroupNotFoundError(
-                            f"Log group not found: {log_group_pattern}"
-                        )
-                    validated_groups.append(log_group_pattern)
-                except LogGroupNotFoundError:
-                    raise
-                except Exception as e:
-                    if 'ResourceNotFoundException' in str(e):
-                        raise LogGroupNotFoundError(
-                            f"Log group not found: {log_group_pattern}\n"
-                            "Please verify the log group exists and you have permissions to access it."
-                        )
-                    raise
-
-        # CloudWatch has a limit of 20 log groups per query
+                validated_groups.append(log_group_pattern)
+
+        # Wildcard expansion can still push the total past the limit
         if len(validated_groups) > 20:
             print(f"WARNING: CloudWatch limits queries to 20 log groups. "
                   f"Using first 20 of {len(validated_groups)} groups.", file=sys.stderr)
@@ -227,13 +298,133 @@ class CloudWatchLogsQueryExecutor:
 
         return validated_groups
 
+    def _expand_log_group_pattern(self, log_group_pattern: str) -> List[str]:
+        """
+        List the log groups matching a wildcard pattern.
+
+        Args:
+            log_group_pattern: Log group pattern containing '*'
+
+        Returns:
+            Matching log group names
+
+        Raises:
+            LogGroupNotFoundError: If no log group matches the pattern
+        """
+        prefix = log_group_pattern.replace('*', '')
+        try:
+            paginator = self.logs_client.get_paginator('describe_log_groups')
+            page_iterator = paginator.paginate(logGroupNamePrefix=prefix)
+
+            pattern_matches = []
+            for page in page_iterator:
+                for log_group in page['logGroups']:
+                    pattern_matches.append(log_group['logGroupName'])
+
+            if not pattern_matches:
+                raise LogGroupNotFoundError(
+                    f"No log groups found matching pattern: {log_group_pattern}"
+                )
+            return pattern_matches
+        except Exception as e:
+            if 'ResourceNotFoundException' in str(e):
+                raise LogGroupNotFoundError(
+                    f"Log group not found: {log_group_pattern}"
+                )
+            raise
+
+    def _find_existing_log_groups(self, names: List[str]) -> set:
+        """
+        Check which exact log group names exist with as few listings as possible.
+
+        Sorted names are grouped while they share a prefix of at least
+        MIN_SHARED_PREFIX_LENGTH characters, and each group is resolved with
+        one listing under that prefix. The listing stops after
+        MAX_GROUP_LISTING_PAGES pages, because sparse names can have many
+        other groups between them. Names it did not reach get their own
+        listing, which behaves like a single lookup.
+
+        Args:
+            names: Exact log group names
+
+        Returns:
+            Set of the given names that exist
+
+        Raises:
+            LogGroupNotFoundError: If a listing reports a missing resource
+        """
+        groups = []
+        for name in sorted(set(names)):
+            # Names are sorted, so a group's common prefix is that of its ends
+            if groups and len(os.path.commonprefix([groups[-1][0], name])) >= self.MIN_SHARED_PREFIX_LENGTH:
+                groups[-1].append(name)
+            else:
+                groups.append([name])
+
+        found = set()
+        for group in groups:
+            if len(group) == 1:
+                found |= self._scan_log_groups(group)[0]
+                continue
+            group_found, unresolved = self._scan_log_groups(group, self.MAX_GROUP_LISTING_PAGES)
+            found |= group_found
+            for name in unresolved:
+                found |= self._scan_log_groups([name])[0]
+        return found
+
+    def _scan_log_groups(self, names: List[str], max_pages: Optional[int] = None) -> Tuple[set, List[str]]:
+        """
+        Find which of the sorted names exist using one paginated listing.
+
+        Lists log groups under the names' common prefix. DescribeLogGroups
+        returns names in ASCII order, so the scan stops once every name is
+        found or the listing has passed the last requested name. For a single
+        name that is always the first page.
+
+        Returns:
+            Tuple of the names found and, if max_pages stopped the scan early,
+            the names the listing had not reached yet
+        """
+        remaining = set(names)
+        last_name = names[-1]
+        found = set()
+
+        try:
+            paginator = self.logs_client.get_paginator('describe_log_groups')
+            page_iterator = paginator.paginate(
+                logGroupNamePrefix=os.path.commonprefix(names),
+                limit=50
+            )
+            for page_number, page in enumerate(page_iterator, 1):
+                name = ''
+                for lg in page['logGroups']:
+                    name = lg['logGroupName']
+                    if name in remaining:
+                        remaining.discard(name)
+                        found.add(name)
+                    if not remaining or name > last_name:
+                        return found, []
+                if max_pages is not None and page_number >= max_pages:
+                    # Names up to the last listed one are known to be missing
+                    return found, sorted(n for n in remaining if n > name)
+        except Exception as e:
+            if 'ResourceNotFoundException' in str(e):
+                raise LogGroupNotFoundError(
+                    f"Log group not found: {', '.join(sorted(remaining))}\n"
+                    "Please verify the log group exists and you have permissions to access it."
+                )
+            raise
+
+        return found, []
+
     def execute_query(
         self,
         query: str,
         log_groups: List[str],
         start_time: str,
         end_time: str,
-        limit: int = 10000
+        limit: int = 10000,
+        validate_existence: bool = False
     ) -> str:
         """
         Execute CloudWatch Log Insights query.
@@ -244,12 +435,14 @@ class CloudWatchLogsQueryExecutor:
             start_time: Start time (various formats supported)
             end_time: End time (various formats supported)
             limit: Maximum results to return
+            validate_existence: Check exact log group names before starting the query
 
         Returns:
             query_id: The query execution ID
 
         Raises:
             QuerySyntaxError: If query syntax is invalid
+            LogGroupNotFoundError: If start_query reports a missing log group
         """
         # Convert times
         try:
@@ -268,7 +461,7 @@ class CloudWatchLogsQueryExecutor:
 
         # Validate log groups
         try:
-            validated_groups = self.validate_log_groups(log_groups)
+            validated_groups = self.validate_log_groups(log_groups, validate_existence)
         except LogGroupNotFoundError as e:
             print(f"✗ Error: {e}", file=sys.stderr)
             sys.exit(1)
@@ -297,6 +490,8 @@ class CloudWatchLogsQueryExecutor:
 
             if 'MalformedQueryException' in str(e) or 'InvalidParameterException' in error_code:
                 raise QuerySyntaxError(f"Invalid query syntax: {e}")
+            elif 'ResourceNotFoundException' in error_code:
+                raise LogGroupNotFoundError(f"Log group not found: {e}")
             elif 'LimitExceededException' in error_code:
                 print("✗ API rate limit exceeded. Please wait and try again.", file=sys.stderr)
                 sys.exit(1)
@@ -323,6 +518,10 @@ class CloudWatchLogsQueryExecutor:
 
         print("Waiting for query to complete...", file=sys.stderr)
 
+        # Never sleep past the next status update
+        max_delay = min(self.POLL_MAX_DELAY_SECONDS, max(update_interval, self.POLL_INITIAL_DELAY_SECONDS))
+        delay = self.POLL_INITIAL_DELAY_SECONDS
+
         while True:
             current_time = time.time()
             elapsed = current_time - self.start_time
@@ -358,8 +557,8 @@ class CloudWatchLogsQueryExecutor:
                     print(f"✗ Query timed out", file=sys.stderr)
                     sys.exit(1)
 
-            # Poll every 2 seconds
-            time.sleep(2)
+            time.sleep(delay)
+            delay = min(delay * self.POLL_BACKOFF_FACTOR, max_delay)
 
     def _print_status_update(self, response: Dict, elapsed: float):
         """
@@ -428,122 +627,162 @@ class CloudWatchLogsQueryExecutor:
             print("No results returned from query")
             return None
 
-        # Get all unique field names
-        all_fields = set()
-        for result in results:
-            for field in result:
-                all_fields.add(field['field'])
-
-        # Sort fields: metadata fields first, then others alphabetically
-        metadata_fields = ['@timestamp', '@message', '@logStream', '@log']
-        sorted_fields = [f for f in metadata_fields if f in all_fields]
-        other_fields = sorted([f for f in all_fields if f not in metadata_fields])
-        sorted_fields.extend(other_fields)
+        # Get all unique field names in one pass. Field names repeat on every
+        # row, so intern them to share one key object across all row dicts.
+        all_fields = dict.fromkeys(sys.intern(field['field']) for result in results for field in result)
 
+        # Order fields: metadata fields first, then others alphabetically
         if exclude_metadata:
-            sorted_fields = [f for f in sorted_fields if not f.startswith('@')]
-
-        # Convert results to list of dicts
-        rows = []
-        for result in results:
-            row = {field['field']: field.get('value', '') for field in result}
-            rows.append(row)
+            sorted_fields = sorted(f for f in all_fields if not f.startswith('@'))
+        else:
+            metadata_fields = ('@timestamp', '@message', '@logStream', '@log')
+            sorted_fields = [f for f in metadata_fields if f in all_fields]
+            sorted_fields += sorted(f for f in all_fields if f not in metadata_fields)
 
         # Format output based on requested format
         if format == 'json':
+            rows = [
+                {sys.intern(field['field']): field.get('value', '') for field in result}
+                for result in results
+            ]
             return self._format_json(rows, output_file)
         elif format == 'csv':
-            return self._format_csv(rows, sorted_fields, output_file)
+            return self._format_csv(self._build_columns(results, sorted_fields), sorted_fields, output_file)
         elif format == 'table':
-            return self._format_table(rows, sorted_fields, output_file)
+            return self._format_table(self._build_columns(results, sorted_fields), sorted_fields, output_file)
         else:
             raise ValueError(f"Unsupported format: {format}")
 
+    def _build_columns(self, results: List[List[Dict]], fields: List[str]) -> List[List[str]]:
+        """
+        Convert results to one list of values per field (structure of arrays).
+
+        Columns are preallocated with '' so fields missing from a result need
+        no extra work, and no per-row dict is ever built.
+
+        Args:
+            results: Query results from CloudWatch
+            fields: Output fields, in column order
+
+        Returns:
+            One list of values per field, each with one entry per result
+        """
+        column_index = {field: i for i, field in enumerate(fields)}
+        columns = [[''] * len(results) for _ in fields]
+
+        for row_index, result in enumerate(results):
+            for field in result:
+                i = column_index.get(field['field'])
+                if i is not None:
+                    columns[i][row_index] = field.get('value', '')
+
+        return columns
+
     def _format_json(self, rows: List[Dict], output_file: Optional[str]) -> Optional[str]:
-        """Format results as JSON."""
-        json_output = json.dumps(rows, indent=2)
+        """Format results as UTF-8 JSON (orjson when available, else streamed stdlib json)."""
+        orjson = _orjson()
+        if orjson is None:
+            import codecs
+            import json
 
         if output_file:
-            with open(output_file, 'w') as f:
-                f.write(json_output)
+            if orjson is not None:
+                with open(output_file, 'wb') as f:
+                    f.write(orjson.dumps(rows, option=orjson.OPT_INDENT_2))
+            else:
+                with open(output_file, 'w', encoding='utf-8') as f:
+                    json.dump(rows, f, indent=2, ensure_ascii=False)
             print(f"✓ Results saved to: {output_file}", file=sys.stderr)
             return output_file
+
+        # Flush pending text output first so it stays ahead of the raw bytes
+        sys.stdout.flush()
+        if orjson is not None:
+            sys.stdout.buffer.write(orjson.dumps(rows, option=orjson.OPT_INDENT_2) + b'\n')
         else:
-            print(json_output)
-            return None
+            # Encode as UTF-8 like orjson, whatever the locale encoding of stdout
+            writer = codecs.getwriter('utf-8')(sys.stdout.buffer)
+            json.dump(rows, writer, indent=2, ensure_ascii=False)
+            writer.write('\n')
+        sys.stdout.buffer.flush()
+        return None
 
     def _format_csv(
         self,
-        rows: List[Dict],
+        columns: List[List[str]],
         fields: List[str],
         output_file: Optional[str]
     ) -> Optional[str]:
         """Format results as CSV."""
+        import csv
+
+        # Positional writer fed row tuples zipped from the columns; no per-row
+        # dict lookups as in DictWriter
+        matrix = zip(*columns)
+
         if output_file:
             with open(output_file, 'w', newline='') as f:
-                writer = csv.DictWriter(f, fieldnames=fields)
-                writer.writeheader()
-                writer.writerows(rows)
+                writer = csv.writer(f)
+                writer.writerow(fields)
+                writer.writerows(matrix)
             print(f"✓ Results saved to: {output_file}", file=sys.stderr)
             return output_file
         else:
-            import io
-            output = io.StringIO()
-            writer = csv.DictWriter(output, fieldnames=fields)
-            writer.writeheader()
-            writer.writerows(rows)
-            print(output.getvalue())
+            writer = csv.writer(sys.stdout)
+            writer.writerow(fields)
+            writer.writerows(matrix)
             return None
 
     def _format_table(
         self,
-        rows: List[Dict],
+        columns: List[List[str]],
         fields: List[str],
         output_file: Optional[str]
     ) -> Optional[str]:
         """Format results as a table."""
-        if not rows:
+        # Truncate long cells to 50 chars for readability, column by column
+        columns = [
+            [value if len(value) <= 50 else value[:47] + '...' for value in map(str, column)]
+            for column in columns
+        ]
+        if not columns or not columns[0]:
             return None
 
-        # Calculate column widths
-        widths = {field: len(field) for field in fields}
-        for row in rows:
-            for field in fields:
-                value = str(row.get(field, ''))
-                widths[field] = max(widths[field], len(value))
+        # Calculate column widths, also limited to 50 chars
+        widths = [
+            min(50, max(len(field), *map(len, column)))
+            for field, column in zip(fields, columns)
+        ]
 
-        # Limit column width to 50 chars for readability
-        for field in widths:
-            widths[field] = min(widths[field], 50)
+        # Pre-built row template; '{:<N}' pads like str.ljust(N)
+        row_format = ' | '.join(f'{{:<{width}}}' for width in widths)
 
-        # Create table
-        lines = []
+        # Create table, encoding each line straight into one growing byte buffer
+        table_output = bytearray()
 
         # Header
-        header = ' | '.join(field.ljust(widths[field]) for field in fields)
-        separator = '-+-'.join('-' * widths[field] for field in fields)
-        lines.append(header)
-        lines.append(separator)
+        header = row_format.format(*fields)
+        separator = '-+-'.join('-' * width for width in widths)
+        table_output += header.encode('utf-8')
+        table_output += b'\n'
+        table_output += separator.encode('utf-8')
 
         # Rows
-        for row in rows:
-            values = []
-            for field in fields:
-                value = str(row.get(field, ''))
-                if len(value) > 50:
-                    value = value[:47] + '...'
-                values.append(value.ljust(widths[field]))
-            lines.append(' | '.join(values))
-
-        table_output = '\n'.join(lines)
+        format_row = row_format.format
+        for cells in zip(*columns):
+            table_output += b'\n'
+            table_output += format_row(*cells).encode('utf-8')
 
         if output_file:
-            with open(output_file, 'w') as f:
+            with open(output_file, 'wb') as f:
                 f.write(table_output)
             print(f"✓ Results saved to: {output_file}", file=sys.stderr)
             return output_file
         else:
-            print(table_output)
+            table_output += b'\n'
+            sys.stdout.flush()
+            sys.stdout.buffer.write(table_output)
+            sys.stdout.buffer.flush()
             return None
 
     def execute_and_save(
@@ -556,7 +795,8 @@ class CloudWatchLogsQueryExecutor:
         format: str = 'table',
         limit: int = 10000,
         update_interval: int = 30,
-        exclude_metadata: bool = False
+        exclude_metadata: bool = False,
+        validate_existence: bool = False
     ):
         """
         Execute query and save results in one operation.
@@ -571,13 +811,14 @@ class CloudWatchLogsQueryExecutor:
             limit: Maximum results to return
             update_interval: Status update interval in seconds
             exclude_metadata: Exclude CloudWatch metadata fields
+            validate_existence: Check exact log group names before starting the query
         """
         if limit > 10000:
             print(f"Warning: CloudWatch Logs Insights caps results at 10,000. "
                   f"--limit {limit} will be silently capped.", file=sys.stderr)
 
         try:
-            query_id = self.execute_query(query, log_groups, start_time, end_time, limit)
+            query_id = self.execute_query(query, log_groups, start_time, end_time, limit, validate_existence)
             response = self.wait_for_results(query_id, update_interval)
 
             results = response.get('results', [])
@@ -642,6 +883,13 @@ Query examples:
         help='Comma-separated log groups or patterns (max 20)'
     )
 
+    parser.add_argument(
+        '--strict-validate',
+        action='store_true',
+        help='Check that exact log group names exist before starting the query '
+             '(default: let start_query report missing log groups)'
+    )
+
     # Time range
     parser.add_argument(
         '--start-time',
@@ -728,7 +976,8 @@ Query examples:
         format=args.format,
         limit=args.limit,
         update_interval=args.update_interval,
-        exclude_metadata=args.exclude_metadata
+        exclude_metadata=args.exclude_metadata,
+        validate_existence=args.strict_validate
     )
 
 
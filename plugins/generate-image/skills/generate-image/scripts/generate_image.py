@@ -8,40 +8,102 @@ It supports both basic text-to-image generation and color-guided generation.
 
 import argparse
 import base64
-import json
+import functools
 import os
 import sys
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import List, Optional
 
 
+@functools.lru_cache(maxsize=None)
+def _json_module():
+    """Import the JSON backend on first use: orjson when available, else json."""
+    try:
+        import orjson
+        return orjson
+    except ImportError:
+        import json
+        return json
+
+
+def _json_dumps(obj) -> bytes:
+    """Serialize to JSON bytes, using orjson when available."""
+    result = _json_module().dumps(obj)
+    return result if isinstance(result, bytes) else result.encode("utf-8")
+
+
+def _json_loads(data):
+    """Parse JSON from str/bytes, using orjson when available."""
+    return _json_module().loads(data)
+
+
+# Default file names: nova_canvas_<UTC timestamp>
+DEFAULT_FILENAME_FORMAT = "nova_canvas_%Y%m%d_%H%M%S"
+
+
+def _default_filename() -> str:
+    """Build the default base file name from the current UTC time."""
+    return datetime.now(timezone.utc).strftime(DEFAULT_FILENAME_FORMAT)
+
+
+@functools.lru_cache(maxsize=16)
+def _get_client(service_name: str, region: str, profile_name: Optional[str]):
+    """Create a boto3 client once per (service, region, profile) and reuse it."""
+    import boto3
+    from botocore.config import Config
+
+    session = boto3.Session(profile_name=profile_name) if profile_name else boto3.Session()
+    return session.client(
+        service_name=service_name,
+        region_name=region,
+        config=Config(
+            # Enough pooled connections for generate_images_batch() fan-out
+            max_pool_connections=50,
+            retries={'mode': 'adaptive', 'max_attempts': 5}
+        )
+    )
+
+
 class NovaCanvasGenerator:
     """Generator class for AWS Bedrock Nova Canvas model."""
 
     # Model ID for Nova Canvas on Bedrock
     MODEL_ID = "amazon.nova-canvas-v1:0"
 
+    # Maximum numberOfImages accepted by a single invoke_model call
+    MAX_IMAGES_PER_REQUEST = 5
+
+    # Upper bound for the seed parameter
+    MAX_SEED = 858993459
+
+    # Supported quality values, in CLI display order, plus a set for lookups
+    QUALITY_CHOICES = ("standard", "premium")
+    VALID_QUALITIES = frozenset(QUALITY_CHOICES)
+
+    # Base64 characters decoded per write; must be a multiple of 4
+    BASE64_CHUNK_SIZE = 64 * 1024
+
     def __init__(self, region: str = "us-east-1", profile_name: Optional[str] = None):
         """
-        Initialize the generator with AWS Bedrock client.
+        Initialize the generator for an AWS Bedrock region.
+
+        The Bedrock client is created on first use, so invalid parameters are
+        reported without paying the boto3 import and session setup cost.
 
         Args:
             region: AWS region where Bedrock is available
             profile_name: AWS profile name to use (optional)
         """
-        import boto3
-        # Create session with profile if specified
-        if profile_name:
-            session = boto3.Session(profile_name=profile_name)
-            self.bedrock = session.client(
-                service_name='bedrock-runtime',
-                region_name=region
-            )
-        else:
-            self.bedrock = boto3.client(
-                service_name='bedrock-runtime',
-                region_name=region
-            )
+        self.region = region
+        self.profile_name = profile_name
+        self._bedrock = None
+
+    @property
+    def bedrock(self):
+        """AWS Bedrock runtime client, created on first access."""
+        if self._bedrock is None:
+            self._bedrock = _get_client('bedrock-runtime', self.region, self.profile_name)
+        return self._bedrock
 
     def generate_image(
         self,
@@ -78,6 +140,26 @@ class NovaCanvasGenerator:
         Returns:
             List of file paths to generated images
         """
+        body = self._build_request_body(
+            prompt, colors=colors, negative_prompt=negative_prompt,
+            width=width, height=height, quality=quality,
+            cfg_scale=cfg_scale, seed=seed, number_of_images=number_of_images
+        )
+        return self._invoke_and_save(body, filename, output_dir)
+
+    def _build_request_body(
+        self,
+        prompt: str,
+        colors: Optional[List[str]] = None,
+        negative_prompt: Optional[str] = None,
+        width: int = 1024,
+        height: int = 1024,
+        quality: str = "standard",
+        cfg_scale: float = 7.0,
+        seed: Optional[int] = None,
+        number_of_images: int = 1
+    ) -> dict:
+        """Validate generation parameters and build the Bedrock request body."""
         # Validate parameters
         self._validate_params(prompt, negative_prompt, width, height,
                             quality, cfg_scale, seed, number_of_images)
@@ -119,15 +201,117 @@ class NovaCanvasGenerator:
         if seed is not None:
             body["imageGenerationConfig"]["seed"] = seed
 
+        return body
+
+    def _invoke_and_save(
+        self,
+        body: dict,
+        filename: Optional[str],
+        output_dir: str,
+        number_files: bool = False
+    ) -> List[str]:
+        """Send a request body to Bedrock and save the returned images."""
         # Call Bedrock
         response = self.bedrock.invoke_model(
             modelId=self.MODEL_ID,
-            body=json.dumps(body)
+            body=_json_dumps(body)
         )
 
         # Parse response and save images
-        response_body = json.loads(response['body'].read())
-        return self._save_images(response_body, filename, output_dir)
+        response_body = _json_loads(response['body'].read())
+        return self._save_images(response_body, filename, output_dir, number_files)
+
+    def generate_images_batch(
+        self,
+        prompts: List[str],
+        output_dir: str,
+        number_of_images: int = 1,
+        max_concurrency: int = 8,
+        filename: Optional[str] = None,
+        seed: Optional[int] = None,
+        **kwargs
+    ) -> List[str]:
+        """
+        Generate images for one or more prompts using concurrent requests.
+
+        Each prompt is split into requests of at most MAX_IMAGES_PER_REQUEST
+        images, and all requests are sent in parallel so network round-trips
+        overlap instead of running back to back.
+
+        Args:
+            prompts: Text descriptions of the images (1-1024 characters each)
+            output_dir: Directory to save generated images (required)
+            number_of_images: Number of images to generate per prompt
+            max_concurrency: Maximum number of in-flight Bedrock requests
+            filename: Base name for saved files (without extension)
+            seed: Seed for the first request; later requests for the same
+                  prompt use consecutive seeds so they produce distinct images
+            **kwargs: Remaining generate_image() parameters, applied to every request
+
+        Returns:
+            List of file paths to generated images, in prompt order
+        """
+        if not prompts:
+            raise ValueError("prompts must contain at least one prompt")
+
+        if number_of_images < 1:
+            raise ValueError("number_of_images must be at least 1")
+
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        if filename is None:
+            filename = _default_filename()
+
+        # Build one request per chunk of up to MAX_IMAGES_PER_REQUEST images
+        requests = []
+        for prompt_index, prompt in enumerate(prompts):
+            chunk_sizes = [
+                min(self.MAX_IMAGES_PER_REQUEST, number_of_images - start)
+                for start in range(0, number_of_images, self.MAX_IMAGES_PER_REQUEST)
+            ]
+            for chunk_index, chunk_size in enumerate(chunk_sizes):
+                request_filename = filename
+                if len(prompts) > 1:
+                    request_filename += f"_p{prompt_index + 1}"
+                if len(chunk_sizes) > 1:
+                    request_filename += f"_b{chunk_index + 1}"
+
+                chunk_seed = None
+                if seed is not None:
+                    chunk_seed = (seed + chunk_index) % (self.MAX_SEED + 1)
+
+                # Validate every request before any is sent, so an invalid
+                # prompt cannot fail the batch after paid calls have gone out
+                body = self._build_request_body(
+                    prompt, seed=chunk_seed, number_of_images=chunk_size, **kwargs
+                )
+                # Number every image of a chunked prompt, even a chunk of one,
+                # so all files match <filename>_b<chunk>_<n>.png
+                requests.append((body, request_filename, len(chunk_sizes) > 1))
+
+        # Create the client on this thread so workers don't race past the
+        # client cache; boto3 clients are thread-safe once created
+        self.bedrock
+
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(requests))) as executor:
+            futures = [
+                executor.submit(self._invoke_and_save, body, request_filename, output_dir, number_files)
+                for body, request_filename, number_files in requests
+            ]
+            saved_files = []
+            try:
+                for future in futures:
+                    saved_files.extend(future.result())
+            except Exception:
+                # Don't start requests that are still queued behind a failure
+                for future in futures:
+                    future.cancel()
+                raise
+
+        return saved_files
 
     def _validate_params(
         self,
@@ -141,62 +325,77 @@ class NovaCanvasGenerator:
         number_of_images: int
     ):
         """Validate generation parameters."""
-        if not prompt or len(prompt) < 1 or len(prompt) > 1024:
+        if not prompt or len(prompt) > 1024:
             raise ValueError("prompt must be between 1 and 1024 characters")
 
-        if negative_prompt and (len(negative_prompt) < 1 or len(negative_prompt) > 1024):
+        if negative_prompt and len(negative_prompt) > 1024:
             raise ValueError("negative_prompt must be between 1 and 1024 characters")
 
-        if width < 320 or width > 4096 or width % 16 != 0:
+        if not (320 <= width <= 4096 and width % 16 == 0):
             raise ValueError("width must be between 320 and 4096 and divisible by 16")
 
-        if height < 320 or height > 4096 or height % 16 != 0:
+        if not (320 <= height <= 4096 and height % 16 == 0):
             raise ValueError("height must be between 320 and 4096 and divisible by 16")
 
-        if quality not in ["standard", "premium"]:
+        if quality not in self.VALID_QUALITIES:
             raise ValueError("quality must be either 'standard' or 'premium'")
 
-        if cfg_scale < 1.1 or cfg_scale > 10.0:
+        if not 1.1 <= cfg_scale <= 10.0:
             raise ValueError("cfg_scale must be between 1.1 and 10.0")
 
-        if seed is not None and (seed < 0 or seed > 858993459):
+        if seed is not None and not 0 <= seed <= self.MAX_SEED:
             raise ValueError("seed must be between 0 and 858993459")
 
-        if number_of_images < 1 or number_of_images > 5:
+        if not 1 <= number_of_images <= self.MAX_IMAGES_PER_REQUEST:
             raise ValueError("number_of_images must be between 1 and 5")
 
     def _save_images(
         self,
         response_body: dict,
         filename: Optional[str],
-        output_dir: str
+        output_dir: str,
+        number_files: bool = False
     ) -> List[str]:
         """Save generated images to files."""
+        images = response_body.get('images', [])
+        if not images:
+            return []
+
         os.makedirs(output_dir, exist_ok=True)
 
         if filename is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"nova_canvas_{timestamp}"
+            filename = _default_filename()
 
         saved_files = []
-        images = response_body.get('images', [])
+        base_path = os.path.join(output_dir, filename)
+        multiple = number_files or len(images) > 1
 
         for i, image_base64 in enumerate(images):
-            if len(images) > 1:
-                output_path = os.path.join(output_dir, f"{filename}_{i+1}.png")
-            else:
-                output_path = os.path.join(output_dir, f"{filename}.png")
+            output_path = f"{base_path}_{i+1}.png" if multiple else f"{base_path}.png"
 
-            # Decode and save image
-            image_data = base64.b64decode(image_base64)
-            with open(output_path, 'wb') as f:
-                f.write(image_data)
+            # Decode and save image in chunks so the full decoded image
+            # never sits in memory alongside its base64 source
+            self._write_base64_file(output_path, image_base64)
 
             saved_files.append(output_path)
             print(f"Saved image to: {output_path}")
 
         return saved_files
 
+    def _write_base64_file(self, output_path: str, image_base64: str):
+        """Decode base64 data chunk by chunk straight into an unbuffered file."""
+        # O_BINARY keeps Windows from translating newline bytes in the PNG data
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+        fd = os.open(output_path, flags, 0o644)
+        try:
+            for start in range(0, len(image_base64), self.BASE64_CHUNK_SIZE):
+                chunk = memoryview(base64.b64decode(image_base64[start:start + self.BASE64_CHUNK_SIZE]))
+                # os.write may write fewer bytes than requested
+                while chunk:
+                    chunk = chunk[os.write(fd, chunk):]
+        finally:
+            os.close(fd)
+
 
 def main():
     """Main entry point for the script."""
@@ -219,13 +418,19 @@ Examples:
 
   # Generate multiple images
   %(prog)s "cat playing" --output-dir ./my_images --number-of-images 3
+
+  # Several prompts and more than 5 images, generated concurrently
+  %(prog)s "cat playing" "dog sleeping" --output-dir ./my_images --number-of-images 8
         """
     )
 
     # Required arguments
     parser.add_argument(
-        "prompt",
-        help="Text description of the image to generate (1-1024 characters)"
+        "prompts",
+        nargs="+",
+        metavar="prompt",
+        help="Text description of the image to generate (1-1024 characters). "
+             "Pass several quoted prompts to generate them concurrently"
     )
 
     # Optional arguments
@@ -261,7 +466,7 @@ Examples:
 
     parser.add_argument(
         "--quality",
-        choices=["standard", "premium"],
+        choices=NovaCanvasGenerator.QUALITY_CHOICES,
         default="standard",
         help="Image quality (default: standard)"
     )
@@ -283,7 +488,15 @@ Examples:
         "--number-of-images",
         type=int,
         default=1,
-        help="Number of images to generate (1-5, default: 1)"
+        help="Number of images to generate per prompt (default: 1). "
+             "Values above 5 are split into concurrent requests of up to 5 images"
+    )
+
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=8,
+        help="Maximum number of concurrent Bedrock requests (default: 8)"
     )
 
     parser.add_argument(
@@ -311,13 +524,13 @@ Examples:
         generator = NovaCanvasGenerator(region=args.region, profile_name=args.aws_profile)
 
         # Generate images
+        total_images = args.number_of_images * len(args.prompts)
         if args.colors:
-            print(f"Generating {args.number_of_images} image(s) with color guidance...")
+            print(f"Generating {total_images} image(s) with color guidance...")
         else:
-            print(f"Generating {args.number_of_images} image(s)...")
+            print(f"Generating {total_images} image(s)...")
 
-        saved_files = generator.generate_image(
-            prompt=args.prompt,
+        params = dict(
             output_dir=args.output_dir,
             colors=args.colors,
             negative_prompt=args.negative_prompt,
@@ -330,6 +543,15 @@ Examples:
             number_of_images=args.number_of_images
         )
 
+        if len(args.prompts) == 1 and args.number_of_images <= NovaCanvasGenerator.MAX_IMAGES_PER_REQUEST:
+            saved_files = generator.generate_image(prompt=args.prompts[0], **params)
+        else:
+            saved_files = generator.generate_images_batch(
+                prompts=args.prompts,
+                max_concurrency=args.max_concurrency,
+                **params
+            )
+
         print(f"\nSuccessfully generated {len(saved_files)} image(s)!")
         return 0
 
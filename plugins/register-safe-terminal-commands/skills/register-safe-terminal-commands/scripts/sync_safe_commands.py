@@ -4,13 +4,27 @@ Script to sync safe terminal commands from safe_terminal_commands.txt to Claude
 Reads commands from TXT file and updates ~/.claude/settings.json permissions.allow array.
 """
 
+import os
 import sys
 import json
 import re
 import shutil
 import argparse
+from itertools import islice
 from pathlib import Path
 from dataclasses import dataclass, field
+from typing import Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Line-end comment marker: '#' preceded by whitespace ('#' inside a command is kept)
+_LINE_END_COMMENT_RE = re.compile(r'\s+#')
+
+# Suffixes of Bash permission entries: current "Bash(cmd *)" and deprecated "Bash(cmd:*)"
+_BASH_PERMISSION_SUFFIXES = (' *)', ':*)')
 
 
 @dataclass
@@ -26,26 +40,27 @@ class SyncReport:
         return len(self.added) + len(self.migrated)
 
     def print_summary(self, verbose: bool = False) -> None:
-        """Print a detailed summary of changes."""
-        print(f"\n📊 Sync Report:")
-        print(f"  ✅ Added: {len(self.added)} commands")
-        print(f"  🔄 Migrated: {len(self.migrated)} commands (deprecated :* -> space format)")
-        print(f"  ⚪ Unchanged: {len(self.unchanged)} commands")
+        """Print a detailed summary of changes, written to stdout in one call."""
+        lines = [
+            f"\n📊 Sync Report:",
+            f"  ✅ Added: {len(self.added)} commands",
+            f"  🔄 Migrated: {len(self.migrated)} commands (deprecated :* -> space format)",
+            f"  ⚪ Unchanged: {len(self.unchanged)} commands",
+        ]
 
         if self.added:
-            print(f"\n  📁 Added commands:")
-            for command in sorted(self.added):
-                print(f"    + {command}")
+            lines.append(f"\n  📁 Added commands:")
+            lines.extend(f"    + {command}" for command in sorted(self.added))
 
         if self.migrated:
-            print(f"\n  🔄 Migrated commands:")
-            for command in sorted(self.migrated):
-                print(f"    ~ {command}")
+            lines.append(f"\n  🔄 Migrated commands:")
+            lines.extend(f"    ~ {command}" for command in sorted(self.migrated))
 
         if verbose and self.unchanged:
-            print(f"\n  ⚪ Unchanged commands:")
-            for command in sorted(self.unchanged):
-                print(f"    = {command}")
+            lines.append(f"\n  ⚪ Unchanged commands:")
+            lines.extend(f"    = {command}" for command in sorted(self.unchanged))
+
+        sys.stdout.write('\n'.join(lines) + '\n')
 
 
 def read_safe_commands_txt(txt_file: Path) -> set[str]:
@@ -55,57 +70,56 @@ def read_safe_commands_txt(txt_file: Path) -> set[str]:
     - Full-line comments: lines starting with #
     - Line-end comments: text after # on the same line as a command
     """
-    commands = set()
     if not txt_file.exists():
-        return commands
+        return set()
 
     try:
+        # Read the whole file at once; text mode already normalizes line endings to '\n'
         with open(txt_file, 'r', encoding='utf-8') as f:
-            for line in f:
-                # Strip whitespace first
-                line = line.strip()
-
-                # Skip empty lines and full-line comments
-                if not line or line.startswith('#'):
-                    continue
-
-                # Handle line-end comments: only strip when '#' follows whitespace
-                # (preserves '#' characters that are part of a command itself)
-                m = re.search(r'\s+#', line)
-                if m:
-                    line = line[:m.start()].strip()
-
-                # Add non-empty command to set
-                if line:
-                    commands.add(line)
+            lines = f.read().split('\n')
     except OSError as e:
         print(f"❌ Error reading safe commands TXT file: {e}")
         sys.exit(1)
 
-    return commands
+    # Skip empty lines and full-line comments; only lines containing '#' need the
+    # line-end comment check. (One MULTILINE regex over the whole text measured
+    # 16x slower on the bundled file and 9x slower on a 20k-line file: its lazy
+    # match and lookahead run at every character.)
+    return {
+        _strip_line_end_comment(line) if '#' in line else line
+        for line in map(str.strip, lines)
+        if line and line[0] != '#'
+    }
+
+
+def _strip_line_end_comment(line: str) -> str:
+    """Remove a line-end comment from a stripped, non-comment line."""
+    m = _LINE_END_COMMENT_RE.search(line)
+    # The match starts at the whitespace before '#', so the kept part is already stripped
+    return line[:m.start()] if m else line
 
 
 def extract_bash_commands_from_settings(settings_data: dict) -> set[str]:
     """Extract bash commands from Claude settings JSON permissions.allow array."""
-    bash_commands = set()
-
     permissions = settings_data.get('permissions', {})
     allow_list = permissions.get('allow', [])
 
-    for permission in allow_list:
-        if isinstance(permission, str) and permission.startswith('Bash('):
-            if permission.endswith(' *)'):
-                command = permission[5:-3]  # Remove "Bash(" prefix and " *)" suffix
-                bash_commands.add(command)
-            elif permission.endswith(':*)'):
-                command = permission[5:-3]  # Remove "Bash(" prefix and ":*)" suffix (deprecated format)
-                bash_commands.add(command)
+    # Remove "Bash(" prefix and " *)" suffix, or ":*)" suffix (deprecated format)
+    return {
+        permission[5:-3]
+        for permission in allow_list
+        if isinstance(permission, str)
+        and permission.startswith('Bash(')
+        and permission.endswith(_BASH_PERMISSION_SUFFIXES)
+    }
 
-    return bash_commands
 
+def add_bash_command_to_settings(settings_data: dict, command: str, allow_set: set[str]) -> None:
+    """Add a bash command to Claude settings JSON permissions.allow array.
 
-def add_bash_command_to_settings(settings_data: dict, command: str) -> None:
-    """Add a bash command to Claude settings JSON permissions.allow array."""
+    allow_set mirrors the entries of permissions.allow for O(1) membership
+    checks and is kept in step with every append.
+    """
     if 'permissions' not in settings_data:
         settings_data['permissions'] = {}
 
@@ -113,7 +127,8 @@ def add_bash_command_to_settings(settings_data: dict, command: str) -> None:
         settings_data['permissions']['allow'] = []
 
     bash_permission = f"Bash({command} *)"
-    if bash_permission not in settings_data['permissions']['allow']:
+    if bash_permission not in allow_set:
+        allow_set.add(bash_permission)
         settings_data['permissions']['allow'].append(bash_permission)
 
 
@@ -132,12 +147,117 @@ def migrate_deprecated_format(settings_data: dict) -> list[str]:
     return migrated
 
 
+def is_permissions_allow_sorted(settings_data: dict) -> bool:
+    """Check whether the permissions.allow array is sorted, in one linear scan."""
+    allow_list = settings_data.get('permissions', {}).get('allow', [])
+    return all(a <= b for a, b in zip(allow_list, islice(allow_list, 1, None)))
+
+
 def sort_permissions_allow(settings_data: dict) -> None:
     """Sort the permissions.allow array alphabetically."""
     if 'permissions' in settings_data and 'allow' in settings_data['permissions']:
         settings_data['permissions']['allow'].sort()
 
 
+def load_settings_json(data: bytes) -> dict:
+    """Parse settings JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dump_settings_json(settings_data: dict) -> bytes:
+    """Serialize settings as 2-space indented UTF-8 JSON with a trailing newline.
+
+    orjson only supports 2-space indentation; the stdlib fallback emits the same layout.
+    """
+    if orjson is not None:
+        return orjson.dumps(settings_data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(settings_data, indent=2, ensure_ascii=False) + '\n').encode('utf-8')
+
+
+def sync_stamp(txt_file: Path, settings_file: Path) -> Optional[str]:
+    """Identify the current state of the source and settings files.
+
+    Combines the source path with the inode, size and modification time of
+    both files, so editing either one (or switching to another plugin version)
+    changes the stamp. Size and inode catch most edits that land within the
+    same tick of a coarse mtime (FAT, some network mounts); --force covers the
+    rest. Returns None if either file is missing.
+    """
+    try:
+        txt_stat = txt_file.stat()
+        settings_stat = settings_file.stat()
+    except OSError:
+        return None
+    return (
+        f"{txt_file}\n"
+        f"{txt_stat.st_ino} {txt_stat.st_size} {txt_stat.st_mtime_ns}\n"
+        f"{settings_stat.st_ino} {settings_stat.st_size} {settings_stat.st_mtime_ns}\n"
+    )
+
+
+def read_sync_stamp(stamp_file: Path) -> Optional[str]:
+    """Read the stamp recorded by the last successful sync, if any."""
+    try:
+        return stamp_file.read_text(encoding='utf-8')
+    except OSError:
+        return None
+
+
+def write_sync_stamp(stamp_file: Path, txt_file: Path, settings_file: Path) -> None:
+    """Record the state after a successful sync; failures only disable the shortcut."""
+    stamp = sync_stamp(txt_file, settings_file)
+    if stamp is None:
+        return
+    try:
+        stamp_file.write_text(stamp, encoding='utf-8')
+    except OSError:
+        pass
+
+
+def backup_settings_file(settings_file: Path, backup_file: Path) -> None:
+    """Keep the current settings under backup_file.
+
+    A hard link shares the existing data instead of copying it: the atomic
+    replace in write_settings_file gives settings_file a new inode, so the link
+    keeps the old content. Falls back to a copy where hard links are unsupported.
+    The new backup is created under a temp name first, so an existing backup
+    is only replaced once the new one exists.
+    """
+    tmp_file = backup_file.with_name(backup_file.name + '.tmp')
+    tmp_file.unlink(missing_ok=True)
+    try:
+        try:
+            # Link the resolved file: a link to a symlink would follow the new content
+            os.link(settings_file.resolve(), tmp_file)
+        except OSError:
+            shutil.copy2(settings_file, tmp_file)
+        os.replace(tmp_file, backup_file)
+    except OSError:
+        tmp_file.unlink(missing_ok=True)
+        raise
+
+
+def write_settings_file(settings_file: Path, data: bytes) -> None:
+    """Write settings atomically via a sibling temp file renamed over the target.
+
+    An interrupted run never leaves a truncated settings.json. A symlinked
+    settings file is updated at its target, and the file mode is preserved.
+    """
+    target = settings_file.resolve()
+    tmp_file = target.with_name(target.name + '.tmp')
+    try:
+        with open(tmp_file, 'wb') as f:
+            f.write(data)
+        if target.exists():
+            shutil.copymode(target, tmp_file)
+        os.replace(tmp_file, target)
+    except OSError:
+        tmp_file.unlink(missing_ok=True)
+        raise
+
+
 def parse_arguments():
     """Parse command-line arguments."""
     parser = argparse.ArgumentParser(
@@ -149,6 +269,7 @@ Examples:
   %(prog)s --dry-run          # Preview changes without writing
   %(prog)s --verbose          # Show all commands including unchanged
   %(prog)s -n -v              # Dry-run with verbose output
+  %(prog)s --force            # Sync even if nothing changed since the last sync
         """
     )
     parser.add_argument(
@@ -161,6 +282,12 @@ Examples:
         action='store_true',
         help='Show all commands including unchanged ones'
     )
+    parser.add_argument(
+        '-f', '--force',
+        action='store_true',
+        help='Sync even if neither file seems changed since the last sync; use it '
+             'when an edit is missed on filesystems with coarse timestamps'
+    )
     return parser.parse_args()
 
 
@@ -176,6 +303,7 @@ def main():
     skill_root = script_dir.parent
     txt_file = skill_root / 'references' / 'safe_terminal_commands.txt'
     settings_file = Path.home() / '.claude' / 'settings.json'
+    stamp_file = settings_file.with_suffix('.json.synced')
 
     print(f"\n📁 Configuration:")
     print(f"  Source: {txt_file}")
@@ -188,16 +316,27 @@ def main():
         print(f"❌ ERROR: Safe commands file does not exist: {txt_file}")
         sys.exit(1)
 
+    # Skip all parsing when neither file changed since the last successful sync.
+    # Dry-run and verbose runs always do the full comparison to report on it.
+    if not (args.dry_run or args.verbose or args.force):
+        stamp = sync_stamp(txt_file, settings_file)
+        if stamp is not None and stamp == read_sync_stamp(stamp_file):
+            print("\n⚪ No changes needed - nothing changed since the last sync (use --force to re-check)")
+            print("\n✅ Safe commands sync completed: 0 changes made")
+            return
+
     # Read commands from TXT file
     print(f"\n🔄 Reading commands from {txt_file.name}...")
     txt_commands = read_safe_commands_txt(txt_file)
     print(f"📊 Loaded {len(txt_commands)} commands from TXT file")
 
-    # Load or create settings file
+    # Load or create settings file. The whole document is parsed because any
+    # write must preserve unrelated keys; unchanged runs already returned above
+    # via the sync stamp, so there is no read-only path to stream-parse.
     if settings_file.exists():
         try:
-            with open(settings_file, 'r', encoding='utf-8') as f:
-                settings_data = json.load(f)
+            with open(settings_file, 'rb') as f:
+                settings_data = load_settings_json(f.read())
             print(f"📊 Loaded existing settings from {settings_file}")
         except (OSError, json.JSONDecodeError) as e:
             print(f"❌ Error reading settings file: {e}")
@@ -216,28 +355,28 @@ def main():
     json_commands = extract_bash_commands_from_settings(settings_data)
     print(f"📊 Found {len(json_commands)} bash commands in settings file")
 
-    # Determine what needs to be synced
-    commands_to_add = txt_commands - json_commands
-    unchanged_commands = txt_commands & json_commands
+    # Determine what needs to be synced (sorted once, reused for adding and reporting)
+    commands_to_add = sorted(txt_commands - json_commands)
+    unchanged_commands = sorted(txt_commands & json_commands)
 
     # Create sync report
     report = SyncReport(
-        added=list(commands_to_add),
+        added=commands_to_add,
         migrated=migrated_commands,
-        unchanged=list(unchanged_commands)
+        unchanged=unchanged_commands
     )
 
+    # Check sortedness before adding; a sorted list plus the sorted block of added
+    # commands is two runs, which list.sort() merges in linear time
+    needs_sorting = not is_permissions_allow_sorted(settings_data)
+
     # Add new commands to settings
     if commands_to_add:
         print(f"\n📝 Adding {len(commands_to_add)} new commands to settings...")
-        for command in sorted(commands_to_add):
-            add_bash_command_to_settings(settings_data, command)
-            print(f"  ✅ Added: {command}")
-
-    # Check if permissions array needs sorting even if no new commands were added
-    current_allow = settings_data.get('permissions', {}).get('allow', [])
-    sorted_allow = sorted(current_allow)
-    needs_sorting = current_allow != sorted_allow
+        allow_set = set(settings_data.get('permissions', {}).get('allow', []))
+        for command in commands_to_add:
+            add_bash_command_to_settings(settings_data, command, allow_set)
+        sys.stdout.write(''.join(f"  ✅ Added: {command}\n" for command in commands_to_add))
 
     if commands_to_add or migrated_commands or needs_sorting:
         # Sort permissions.allow array alphabetically before saving
@@ -251,15 +390,14 @@ def main():
             if settings_file.exists():
                 backup_file = settings_file.with_suffix('.json.bak')
                 try:
-                    shutil.copy2(settings_file, backup_file)
+                    backup_settings_file(settings_file, backup_file)
                     print(f"\n💾 Created backup: {backup_file}")
                 except OSError as e:
                     print(f"⚠️  Warning: Could not create backup: {e}")
 
             # Write updated settings file
             try:
-                with open(settings_file, 'w', encoding='utf-8') as f:
-                    json.dump(settings_data, f, indent=4, ensure_ascii=False)
+                write_settings_file(settings_file, dump_settings_json(settings_data))
                 print(f"💾 Updated settings file (sorted alphabetically): {settings_file}")
             except OSError as e:
                 print(f"❌ Error writing settings file: {e}")
@@ -267,6 +405,9 @@ def main():
     else:
         print(f"\n⚪ No changes needed - files are already in sync")
 
+    if not args.dry_run:
+        write_sync_stamp(stamp_file, txt_file, settings_file)
+
     # Print summary
     report.print_summary(verbose=args.verbose)
 